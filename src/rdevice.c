@@ -167,6 +167,7 @@ extern void dc_set_baud(int baud);
 #include <netinet/in.h>
 #include <netdb.h>
 #include <arpa/inet.h>
+#include <netinet/tcp.h>
 #include <sys/time.h>
 #endif /* R_NETWORK */
 #include <sys/types.h>
@@ -725,6 +726,24 @@ static void xio_40(void)
 
 }
 
+/*---------------------------------------------------------------------------
+   Host Support Function - Disable Nagle's algorithm on a connected socket.
+   The R: device sends one byte per PUT, so without this every keystroke
+   may wait on the peer's delayed ACK before it goes out.
+---------------------------------------------------------------------------*/
+#ifdef R_NETWORK
+static void set_nodelay(int fd)
+{
+#ifdef TCP_NODELAY
+  int on = 1;
+  if(setsockopt(fd, IPPROTO_TCP, TCP_NODELAY, (void *) &on, sizeof(on)) < 0)
+  {
+    DBG_APRINT("R*: warning, could not set TCP_NODELAY");
+  }
+#endif /* TCP_NODELAY */
+}
+#endif /* R_NETWORK */
+
 /*---------------------------------------------------------------------------
    Host Support Function - Internet Socket Open Connection
 ---------------------------------------------------------------------------*/
@@ -754,6 +773,7 @@ static void open_connection(char * address, int port)
     memset ( &peer_in, 0, sizeof ( struct sockaddr_in ) );
     /*rdev_fd = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP);*/
     rdev_fd = socket(AF_INET, SOCK_STREAM, 0);
+    set_nodelay(rdev_fd);
 #ifdef HAVE_WINDOWS_H
     ioctlsocket(rdev_fd, FIONBIO, &ioctlsocket_non_block);
 #else
@@ -1263,6 +1283,7 @@ void RDevice_STAT(void)
       if(rdev_fd != -1)
       {
         struct hostent *host;
+        set_nodelay(rdev_fd);
         if (getpeername(rdev_fd, (struct sockaddr *) &peer_in, &len) < 0)
         {
           perror("getpeername");